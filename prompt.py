@@ -4,125 +4,543 @@
 Script that sends prompts to a local Ollama server.
 
 Features:
-- Sends prompts to the Ollama API and retrieves responses
-- Suppresses all warnings from the urllib3 library
+- Sends prompts to the Ollama API over persistent keep-alive connections
+- Caches responses on disk so repeated prompts skip the network entirely
 - Allows model specification with -m/--model option
 - Logs all interactions to chat_history.txt in JSON format with timestamp and username
 '''
 
-import requests
 import json
 import argparse
-import warnings
-import urllib3
+import http.client
 import os
 import sys
 import re
-import subprocess
-import datetime
-import getpass
-from contextlib import contextmanager
-
-@contextmanager
-def suppress_stdout_stderr():
-    """Context manager to suppress stdout and stderr output."""
-    # Save original stdout/stderr
-    old_stdout = sys.stdout
-    old_stderr = sys.stderr
-    null_fd = os.open(os.devnull, os.O_RDWR)
-    # Redirect stdout/stderr to devnull
+import time
+import atexit
+import collections
+import functools
+import threading
+import urllib.parse
+import concurrent.futures
+
+# orjson parses/serializes JSON several times faster than the stdlib;
+# fall back to stdlib json if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# fcntl is POSIX-only; without it log compaction runs unlocked
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Invariants computed once at import instead of on every call
+DEFAULT_URL = "http://localhost:11434/api/generate"
+_SYSTEM_PROMPT = "You are a senior Site Reliability Engineer and Systems Administrator. You will provide short concise answers to technical questions no longer than 140 characters. Do not provide a follow up, do not provide any other responses other than the answer."
+_SCRIPT_DIR = os.path.dirname(os.path.realpath(__file__))
+_LOG_PATH = os.path.join(_SCRIPT_DIR, "chat_history.txt")
+
+# Username looked up (and getpass imported) only once logging happens
+_USERNAME = None
+
+def _get_username():
+    global _USERNAME
+    if _USERNAME is None:
+        import getpass
+        _USERNAME = getpass.getuser()
+    return _USERNAME
+
+# Persistent keep-alive connections, one per endpoint, reused across
+# calls instead of paying TCP setup per request
+_HEADERS = {"Content-Type": "application/json"}
+_CONNECT_TIMEOUT = 0.5
+_READ_TIMEOUT = 30
+_CONNECTIONS = {}
+
+def _request(conn, target, body):
+    """Issue one POST on conn and return (status, raw body).
+
+    http.client dials (with conn's short connect timeout) whenever the
+    socket is unset; once connected the socket timeout is widened for
+    the read phase so a slow generation still gets its 30s.
+    """
+    conn.request("POST", target, body=body, headers=_HEADERS)
+    if conn.sock is not None:
+        conn.sock.settimeout(_READ_TIMEOUT)
+    response = conn.getresponse()
+    return response.status, response.read()
+
+def _close_connection(url):
+    """Best-effort close and evict the pooled connection for url's endpoint."""
+    parts = urllib.parse.urlsplit(url)
+    conn = _CONNECTIONS.pop((parts.hostname, parts.port), None)
+    if conn is not None:
+        try:
+            conn.close()
+        except OSError:
+            pass
+
+def _post(url, body, cancelled=None):
+    """POST body to url over a pooled connection; return (status, raw body).
+
+    A keep-alive connection the peer has since closed (server restart,
+    idle timeout) fails on reuse; in that case the request is retried
+    once on a fresh dial before the error propagates, matching what
+    urllib3 did for stale pooled connections. When cancelled (an Event
+    set once a racing attempt has already won) the retry is skipped —
+    the failure came from our own side closing the loser's socket.
+    """
+    parts = urllib.parse.urlsplit(url)
+    key = (parts.hostname, parts.port)
+    conn = _CONNECTIONS.get(key)
+    reused = conn is not None and conn.sock is not None
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        conn = conn_class(parts.hostname, parts.port, timeout=_CONNECT_TIMEOUT)
+        _CONNECTIONS[key] = conn
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
     try:
-        sys.stdout = os.fdopen(null_fd, 'w')
-        sys.stderr = sys.stdout
-        yield
-    finally:
-        # Restore stdout/stderr
-        sys.stdout = old_stdout
-        sys.stderr = old_stderr
+        return _request(conn, target, body)
+    except Exception:
+        # Drop the broken socket; conn redials on its next request
+        conn.close()
+        if not reused or (cancelled is not None and cancelled.is_set()):
+            raise
+        # The failure came over a reused socket, so the server probably
+        # closed the idle connection under us — retry once fresh
+        try:
+            return _request(conn, target, body)
+        except Exception:
+            conn.close()
+            raise
+
+# WSL nameserver IP resolved from /etc/resolv.conf, cached after the first
+# attempt (successful or not) so retries skip the file read and regex
+_NAMESERVER_RE = re.compile(rb'nameserver\s+(\d+\.\d+\.\d+\.\d+)')
+_WSL_IP = None
+_WSL_IP_TRIED = False
+
+def _get_wsl_ip():
+    """Return the WSL nameserver IP from /etc/resolv.conf, or None."""
+    global _WSL_IP, _WSL_IP_TRIED
+    if not _WSL_IP_TRIED:
+        _WSL_IP_TRIED = True
+        try:
+            with open("/etc/resolv.conf", "rb") as f:
+                match = _NAMESERVER_RE.search(f.read())
+            if match:
+                _WSL_IP = match.group(1).decode()
+        except OSError:
+            pass
+    return _WSL_IP
+
+# Fallback URLs computed once per endpoint; None means no fallback applies
+_FALLBACK_URL_CACHE = {}
+
+def _wsl_fallback_url(url):
+    """Return url with its localhost netloc swapped for the WSL nameserver IP.
+
+    Only rewrites the host component (a plain string replace could corrupt
+    URLs containing "localhost" in the path). Returns None when the URL
+    doesn't point at localhost or no WSL IP could be resolved.
+    """
+    if url in _FALLBACK_URL_CACHE:
+        return _FALLBACK_URL_CACHE[url]
+    fallback = None
+    parts = urllib.parse.urlsplit(url)
+    if parts.hostname == "localhost":
+        wsl_ip = _get_wsl_ip()
+        if wsl_ip:
+            netloc = wsl_ip if parts.port is None else f"{wsl_ip}:{parts.port}"
+            fallback = parts._replace(netloc=netloc).geturl()
+    _FALLBACK_URL_CACHE[url] = fallback
+    return fallback
+
+def _resolve_urls(url, fallback=True):
+    """Return the candidate endpoint URLs for a request, primary first."""
+    urls = [url]
+    if fallback:
+        wsl_url = _wsl_fallback_url(url)
+        if wsl_url:
+            urls.append(wsl_url)
+    return urls
+
+# On-disk response cache shared by all invocations of the CLI
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cli-helper")
+CACHE_DB_PATH = os.path.join(CACHE_DIR, "responses.sqlite")
+DEFAULT_CACHE_TTL = 86400  # seconds (1 day)
+
+def _cache_connect():
+    """Open the response cache database, creating it on first use."""
+    import sqlite3
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    conn = sqlite3.connect(CACHE_DB_PATH, isolation_level=None)
+    # WAL mode lets concurrent CLI invocations read/write safely
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS cache(key TEXT PRIMARY KEY, response TEXT, ts INTEGER)")
+    return conn
+
+def _cache_key(model, system_prompt, user_prompt):
+    """Build a content-addressable key for a (model, prompts) triple."""
+    import hashlib
+    return hashlib.sha256(f"{model}\0{system_prompt}\0{user_prompt}".encode()).hexdigest()
 
-def send_prompt(user_prompt, model="gemma3:12b", url="http://localhost:11434/api/generate"):
+@functools.lru_cache(maxsize=256)
+def _cache_get(key, ttl):
+    """Return the cached response for key if it is fresher than ttl, else None.
+
+    Results (hits and misses alike) are memoized in-process so hot loops
+    re-issuing the same prompt pay a dict lookup instead of a SQLite
+    open + query. _cache_put clears the memo when new entries land.
+    """
+    import sqlite3
+    try:
+        conn = _cache_connect()
+        try:
+            cutoff = int(time.time()) - ttl
+            row = conn.execute("SELECT response FROM cache WHERE key=? AND ts > ?", (key, cutoff)).fetchone()
+            return row[0] if row else None
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        return None
+
+def _cache_put(key, response):
+    """Store a response in the cache, silently ignoring cache failures."""
+    import sqlite3
+    try:
+        conn = _cache_connect()
+        try:
+            conn.execute("INSERT OR REPLACE INTO cache(key, response, ts) VALUES (?, ?, ?)",
+                         (key, response, int(time.time())))
+        finally:
+            conn.close()
+        _cache_get.cache_clear()
+    except (sqlite3.Error, OSError):
+        pass
+
+def _parse_response(content):
+    """Extract the model's text from a raw Ollama API response body."""
+    payload = orjson.loads(content) if orjson else json.loads(content)
+    return payload.get("response", "")
+
+def send_prompt(user_prompt, model="gemma3:12b", url=None,
+                use_cache=True, ttl=DEFAULT_CACHE_TTL, semantic=False, fallback=True):
     """
     Send a prompt to the local Ollama server and return the response.
-    
+
     Args:
         user_prompt (str): The prompt to send to the model
         model (str): The model name to use (default: gemma3:12b)
         url (str): The Ollama server endpoint (default: localhost:11434)
-    
+        use_cache (bool): Whether to use the on-disk response cache (default: True)
+        ttl (int): Maximum age in seconds of a cached response (default: 1 day)
+        semantic (bool): Also match paraphrased prompts via local embeddings
+            (default: False; requires sentence-transformers)
+        fallback (bool): Also try the WSL nameserver IP when the endpoint
+            points at localhost (default: True)
+
     Returns:
         str: The response from the model or error message
     """
-    system_prompt = "You are a senior Site Reliability Engineer and Systems Administrator. You will provide short concise answers to technical questions no longer than 140 characters. Do not provide a follow up, do not provide any other responses other than the answer."
-    headers = {"Content-Type": "application/json"}
+    if url is None:
+        url = DEFAULT_URL
+    # Check the on-disk cache before hitting the network
+    cache_key = _cache_key(model, _SYSTEM_PROMPT, user_prompt)
+    if use_cache:
+        cached = _cache_get(cache_key, ttl)
+        if cached is not None:
+            return cached
+        # Exact match missed; optionally try a semantically similar prompt
+        if semantic:
+            cached = _semantic_get(user_prompt, model)
+            if cached is not None:
+                return cached
+
     data = {
         "model": model,
-        "prompt": f"{system_prompt}\n\nUser: {user_prompt}",
+        "prompt": _SYSTEM_PROMPT + "\n\nUser: " + user_prompt,
         "stream": False
     }
-    
-    # Try with provided/default URL (localhost)
+    # Serialize the request body once, with orjson when available
+    body = orjson.dumps(data) if orjson else json.dumps(data).encode()
+
+    # Race the candidate endpoints concurrently instead of waiting out a
+    # full timeout before the second attempt; the first 200 wins
+    urls = _resolve_urls(url, fallback)
+
+    cancelled = threading.Event()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=len(urls))
     try:
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            response = requests.post(url, headers=headers, json=data, timeout=10)
-        if response.status_code == 200:
-            return response.json().get("response", "")
-    except (requests.RequestException, json.JSONDecodeError):
-        pass
-        
-    # If localhost failed and we're using it, try with WSL nameserver IP
-    if "localhost" in url:
-        try:
-            # Read /etc/resolv.conf to get WSL nameserver IP
-            with open("/etc/resolv.conf", "r") as f:
-                resolv_conf = f.read()
-                # Extract the nameserver IP
-                match = re.search(r'nameserver\s+([0-9]+\.[0-9]+\.[0-9]+\.[0-9]+)', resolv_conf)
-                if match:
-                    wsl_ip = match.group(1)
-                    wsl_url = url.replace("localhost", wsl_ip)
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore")
-                        response = requests.post(wsl_url, headers=headers, json=data, timeout=10)
-                    if response.status_code == 200:
-                        return response.json().get("response", "")
-
-        except (FileNotFoundError, requests.RequestException, json.JSONDecodeError):
-            pass
-    
+        futures = {executor.submit(_post, target, body, cancelled): target for target in urls}
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                status, content = future.result()
+                if status != 200:
+                    continue
+                result = _parse_response(content)
+            except (http.client.HTTPException, OSError, ValueError):
+                continue
+            # First 200 wins: close the losing endpoints' connections so
+            # the server can abort the duplicate generation and the next
+            # call finds a clean connection in the pool
+            cancelled.set()
+            for loser, loser_url in futures.items():
+                if loser is not future:
+                    loser.cancel()
+                    _close_connection(loser_url)
+            if use_cache:
+                _cache_put(cache_key, result)
+                if semantic:
+                    _semantic_put(user_prompt, model, result)
+            return result
+    finally:
+        # Don't wait for the losing attempt to finish or time out
+        executor.shutdown(wait=False, cancel_futures=True)
+
     # If all attempts failed
     return "Cannot contact ollama server."
 
 # Command execution functionality removed as requested
 
-def log_interaction(prompt, response, model):
+# Optional semantic cache tier (opt-in via --semantic): embeds prompts
+# locally and reuses responses for paraphrased queries
+EMBEDDINGS_PATH = os.path.join(CACHE_DIR, "embeddings.npy")
+SEMANTIC_ENTRIES_PATH = os.path.join(CACHE_DIR, "semantic_entries.json")
+SEMANTIC_THRESHOLD = 0.90
+
+_EMBED_MODEL = None
+_SEMANTIC_WARNED = False
+
+def _get_embed_model():
+    """Lazily load the local embedding model (downloads it on first use)."""
+    global _EMBED_MODEL
+    if _EMBED_MODEL is None:
+        from sentence_transformers import SentenceTransformer
+        _EMBED_MODEL = SentenceTransformer("all-MiniLM-L6-v2")
+    return _EMBED_MODEL
+
+def _semantic_warn_once():
+    global _SEMANTIC_WARNED
+    if not _SEMANTIC_WARNED:
+        _SEMANTIC_WARNED = True
+        print("Warning: --semantic requires the sentence-transformers package")
+
+def _semantic_get(user_prompt, model):
+    """Return the stored response for a semantically similar past prompt, or None."""
+    try:
+        import numpy as np
+        if not (os.path.exists(EMBEDDINGS_PATH) and os.path.exists(SEMANTIC_ENTRIES_PATH)):
+            return None
+        embeddings = np.load(EMBEDDINGS_PATH)
+        with open(SEMANTIC_ENTRIES_PATH, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        if len(entries) != len(embeddings) or not entries:
+            return None
+        # Embeddings are normalized, so inner product == cosine similarity
+        vec = _get_embed_model().encode([user_prompt], normalize_embeddings=True)[0]
+        sims = embeddings @ vec
+        best = int(sims.argmax())
+        if sims[best] >= SEMANTIC_THRESHOLD and entries[best]["model"] == model:
+            return entries[best]["response"]
+        return None
+    except ImportError:
+        _semantic_warn_once()
+        return None
+    except Exception:
+        return None
+
+def _semantic_put(user_prompt, model, response):
+    """Add a prompt embedding and its response to the semantic cache."""
+    try:
+        import numpy as np
+        vec = _get_embed_model().encode([user_prompt], normalize_embeddings=True)
+        entries = []
+        if os.path.exists(EMBEDDINGS_PATH) and os.path.exists(SEMANTIC_ENTRIES_PATH):
+            embeddings = np.vstack([np.load(EMBEDDINGS_PATH), vec])
+            with open(SEMANTIC_ENTRIES_PATH, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        else:
+            embeddings = vec
+        entries.append({"model": model, "prompt": user_prompt, "response": response})
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        np.save(EMBEDDINGS_PATH, embeddings)
+        with open(SEMANTIC_ENTRIES_PATH, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+    except ImportError:
+        _semantic_warn_once()
+    except Exception:
+        pass
+
+# Process-lifetime log file descriptor, opened lazily so importing the
+# module doesn't touch the filesystem
+_LOG_FD = None
+
+def _get_log_fd():
+    """Return the shared log file descriptor, opening it on first use.
+
+    O_APPEND makes each write an atomic append on POSIX, so concurrent
+    CLI invocations can share the log without locking.
     """
-    Log the interaction to chat_history.txt in the script directory with timestamp and user.
-    Format: JSON object with timestamp, username, model, prompt, and response fields
+    global _LOG_FD
+    if _LOG_FD is None:
+        _LOG_FD = os.open(_LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    return _LOG_FD
+
+# Entries queued between flushes so a burst of prompts costs one syscall
+_LOG_QUEUE = collections.deque()
+
+def _write_buffers(buffers):
+    """Write pre-encoded log lines with a single syscall where possible.
+
+    A shared lock is held for the duration of the write: appenders don't
+    block each other (O_APPEND already makes the writes atomic), but
+    compact_history's exclusive lock can't cut in between our append and
+    its rewrite and destroy the entry.
     """
-    # Get script directory
-    script_dir = os.path.dirname(os.path.realpath(__file__))
-    log_path = os.path.join(script_dir, "chat_history.txt")
-    
-    # Get current time in syslog format (e.g., Jun 27 22:20:11)
-    timestamp = datetime.datetime.now().strftime("%b %d %H:%M:%S")
-    
-    # Get current username
-    username = getpass.getuser()
-    
-    # Create log entry as JSON
-    log_entry = json.dumps({
+    fd = _get_log_fd()
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_SH)
+    try:
+        if hasattr(os, "writev"):
+            os.writev(fd, buffers)
+        else:
+            os.write(fd, b"".join(buffers))
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+
+def flush_log():
+    """Drain all queued log entries to disk in one writev."""
+    if not _LOG_QUEUE:
+        return
+    buffers = []
+    while _LOG_QUEUE:
+        buffers.append(_LOG_QUEUE.popleft())
+    try:
+        _write_buffers(buffers)
+    except Exception as e:
+        print(f"Warning: Could not log to chat_history.txt: {str(e)}")
+
+# The queue is drained at interpreter exit; the descriptor itself is
+# closed by the OS on process teardown
+atexit.register(flush_log)
+
+# History compaction: entries older than this are moved into a
+# zstd-compressed archive next to the plaintext log
+HISTORY_ARCHIVE_PATH = os.path.join(_SCRIPT_DIR, "chat_history.jsonl.zst")
+COMPACT_STAMP_PATH = os.path.join(CACHE_DIR, "compact.stamp")
+COMPACT_AGE_SECONDS = 7 * 86400
+
+def compact_history():
+    """
+    Move log entries older than a week into chat_history.jsonl.zst.
+
+    Runs at most once per day (guarded by a stamp file) and is a no-op
+    when the zstandard package isn't installed. Keeps the plaintext log
+    small so long-lived shells aren't reading back megabytes of history.
+    """
+    now = time.time()
+    try:
+        if now - os.path.getmtime(COMPACT_STAMP_PATH) < 86400:
+            return
+    except OSError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        return
+    try:
+        cutoff = now - COMPACT_AGE_SECONDS
+        this_year = time.localtime(now).tm_year
+
+        def entry_ts(line):
+            # Timestamps are syslog format without a year; assume the
+            # current year and roll back one if that lands in the future
+            entry = orjson.loads(line) if orjson else json.loads(line)
+            parsed = time.strptime(f"{this_year} {entry['timestamp']}", "%Y %b %d %H:%M:%S")
+            ts = time.mktime(parsed)
+            if ts > now + 86400:
+                ts = time.mktime((this_year - 1,) + parsed[1:])
+            return ts
+
+        with open(_LOG_PATH, "r+b") as f:
+            if fcntl is not None:
+                # Exclusive lock for the whole read-compress-rewrite pass:
+                # it excludes other compactors (the stamp check alone is
+                # not mutual exclusion) and in-flight appends, which hold
+                # a shared lock, so no entry can land between our read
+                # and the truncate and be destroyed. Non-blocking: if the
+                # lock is busy, defer the pass rather than stall the CLI.
+                try:
+                    fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    return
+            old, recent = [], []
+            for line in f:
+                try:
+                    (old if entry_ts(line) < cutoff else recent).append(line)
+                except Exception:
+                    # Unparseable lines are kept in the plaintext log
+                    recent.append(line)
+
+            if old:
+                compressed = zstandard.ZstdCompressor(level=3).compress(b"".join(old))
+                with open(HISTORY_ARCHIVE_PATH, "ab") as arch:
+                    arch.write(compressed)
+                # Rewrite in place so the shared O_APPEND descriptor keeps
+                # pointing at the live inode
+                f.seek(0)
+                f.write(b"".join(recent))
+                f.truncate()
+
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(COMPACT_STAMP_PATH, "w"):
+            pass
+    except (OSError, zstandard.ZstdError):
+        pass
+
+def _serialize_entry(prompt, response, model):
+    """Build one log line as UTF-8 JSON bytes, newline included."""
+    # Get current time in syslog format (e.g., Jun 27 22:20:11);
+    # time.strftime is a thin libc wrapper with no datetime allocation
+    timestamp = time.strftime("%b %d %H:%M:%S")
+    entry = {
         "timestamp": timestamp,
-        "username": username,
+        "username": _get_username(),
         "model": model,
         "prompt": prompt,
         "response": response
-    })
-    
-    # Write to log file
+    }
+    return (orjson.dumps(entry) if orjson else json.dumps(entry).encode()) + b"\n"
+
+def log_interaction(prompt, response, model):
+    """
+    Log the interaction to chat_history.txt in the script directory with timestamp and user.
+    Format: JSON object with timestamp, username, model, prompt, and response fields
+
+    Entries are queued in memory; call flush_log() to force them to disk
+    (main() does, and an atexit hook catches anything left over).
+    """
+    _LOG_QUEUE.append(_serialize_entry(prompt, response, model))
+
+def log_interactions_batch(interactions):
+    """
+    Log several interactions with a single syscall.
+
+    Args:
+        interactions: iterable of (prompt, response, model) tuples
+    """
+    buffers = [_serialize_entry(p, r, m) for p, r, m in interactions]
+    if not buffers:
+        return
     try:
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(log_entry + "\n")
+        _write_buffers(buffers)
     except Exception as e:
         print(f"Warning: Could not log to chat_history.txt: {str(e)}")
 
@@ -130,16 +548,26 @@ def main():
     parser = argparse.ArgumentParser(description="Send a prompt to a local Ollama server.")
     parser.add_argument("prompt", nargs="+", help="The prompt to send to the model")
     parser.add_argument("-m", "--model", default="gemma3:12b", help="The model to use (default: gemma3:12b)")
+    parser.add_argument("--no-cache", action="store_true", help="Skip the on-disk response cache")
+    parser.add_argument("--ttl", type=int, default=DEFAULT_CACHE_TTL,
+                        help=f"Maximum age in seconds of a cached response (default: {DEFAULT_CACHE_TTL})")
+    parser.add_argument("--semantic", action="store_true",
+                        help="Also reuse cached responses for paraphrased prompts (requires sentence-transformers)")
     args = parser.parse_args()
-    
+
     # Join the prompt arguments into a single string
     user_prompt = " ".join(args.prompt)
-    
-    response = send_prompt(user_prompt, model=args.model)
+
+    response = send_prompt(user_prompt, model=args.model, use_cache=not args.no_cache,
+                           ttl=args.ttl, semantic=args.semantic)
     print(f">> {response}")
     
     # Log the interaction
     log_interaction(user_prompt, response, args.model)
+    flush_log()
+
+    # Daily background maintenance on the plaintext log
+    compact_history()
 
 if __name__ == "__main__":
     # Set environment variable to ignore all warnings (from ollama_prompt.py)